@@ -1,7 +1,13 @@
-from fastapi import FastAPI
+import asyncio
+import signal
+import threading
+
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from app.stream import ArticleStream, article_summary, sse_events
 from utils.db import get_db
 
 
@@ -33,9 +39,54 @@ class ArticleOut(BaseModel):
 
 
 @app.on_event("startup")
-def startup_db():
+async def startup_db():
     # get_db uses mongomock if MONGODB_URI is not set, so this works locally
     app.state.db = get_db()
+    # one change stream watcher shared by all /articles/stream clients
+    app.state.article_stream = ArticleStream(app.state.db.articles)
+    app.state.article_stream.start()
+    _close_streams_on_exit(app.state.article_stream)
+
+
+# signal -> handler that was installed before ours
+_previous_handlers: dict = {}
+
+
+def _close_streams_on_exit(stream: ArticleStream):
+    # Uvicorn waits for open connections before running shutdown handlers,
+    # and SSE responses never close on their own: end them on SIGINT/SIGTERM.
+    # Signal handlers can only be set from the main thread (not under
+    # TestClient, for example); --timeout-graceful-shutdown is the backstop.
+    if threading.current_thread() is not threading.main_thread() or _previous_handlers:
+        return
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        _previous_handlers[sig] = signal.getsignal(sig)
+
+        def handler(signum, frame):
+            loop.call_soon_threadsafe(stream.close)
+            previous = _previous_handlers.get(signum)
+            if callable(previous):
+                previous(signum, frame)
+            elif previous != signal.SIG_IGN:
+                # default action (e.g. terminate): put it back and re-raise
+                signal.signal(signum, signal.SIG_DFL)
+                signal.raise_signal(signum)
+
+        signal.signal(sig, handler)
+
+
+def _restore_signal_handlers():
+    for sig, previous in _previous_handlers.items():
+        signal.signal(sig, previous if previous is not None else signal.SIG_DFL)
+    _previous_handlers.clear()
+
+
+@app.on_event("shutdown")
+def shutdown_stream():
+    app.state.article_stream.stop()
+    if threading.current_thread() is threading.main_thread():
+        _restore_signal_handlers()
 
 
 @app.get("/health")
@@ -48,17 +99,23 @@ def list_articles():
     db = app.state.db
     coll = db.articles
     docs = coll.find().sort([("fetched_at", -1)]).limit(50)
-    out = []
-    for d in docs:
-        out.append({
-            "id": str(d.get("_id")),
-            "title": d.get("title"),
-            "url": d.get("url"),
-            "image_url": d.get("image_url"),
-            "source_name": (d.get("source") or {}).get("name"),
-            "tags": d.get("tags") or [],
-        })
-    return out
+    return [article_summary(d) for d in docs]
+
+
+@app.get("/articles/stream")
+def stream_articles(last_event_id: str | None = Header(None)):
+    """Server-sent events: one `article` event per newly ingested article."""
+    stream = app.state.article_stream
+    if stream.available is None:
+        raise HTTPException(status_code=503, detail="Live updates are starting", headers={"Retry-After": "5"})
+    if not stream.available:
+        raise HTTPException(status_code=503, detail="Live updates need a MongoDB replica set")
+    return StreamingResponse(
+        sse_events(stream, last_event_id),
+        media_type="text/event-stream",
+        # X-Accel-Buffering: stop nginx from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/admin/translations")
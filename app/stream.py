@@ -0,0 +1,221 @@
+"""
+Live feed of newly ingested articles for the `/articles/stream` SSE endpoint.
+
+One background thread watches `db.articles` through a MongoDB change stream
+(the fetcher runs as a separate process, so the database is the only place we
+can see inserts) and fans each new article out to every connected client.
+Change stream resume tokens are used as SSE event ids so that:
+- the watcher resumes where it left off after a dropped connection
+- reconnecting browsers (Last-Event-ID) get the events they missed, as long
+  as those are still in the recent-events buffer
+
+Both the resume token and the buffer live in memory only: after an API
+restart the watcher starts from "now". Whenever a gap can't be replayed
+(unknown Last-Event-ID, or the watcher had to start fresh) clients get an
+`event: reset` and should re-fetch /articles.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+# Only inserts matter, and only the fields list_articles exposes: keeps
+# content_raw (full page HTML) off the wire between MongoDB and the API.
+PIPELINE = [
+    {"$match": {"operationType": "insert"}},
+    {"$project": {
+        "fullDocument._id": 1,
+        "fullDocument.title": 1,
+        "fullDocument.url": 1,
+        "fullDocument.image_url": 1,
+        "fullDocument.source.name": 1,
+        "fullDocument.tags": 1,
+    }},
+]
+BUFFER_SIZE = 200  # recent events kept for Last-Event-ID replay
+CLIENT_QUEUE_SIZE = 256  # > BUFFER_SIZE; slow clients beyond this are disconnected
+RETRY_DELAY = 5.0  # seconds before re-opening a failed change stream
+RESET = object()  # queue marker: client must re-fetch /articles
+
+
+def article_summary(d: Dict) -> Dict:
+    """Compact article shape shared by /articles and /articles/stream."""
+    return {
+        "id": str(d.get("_id")),
+        "title": d.get("title"),
+        "url": d.get("url"),
+        "image_url": d.get("image_url"),
+        "source_name": (d.get("source") or {}).get("name"),
+        "tags": d.get("tags") or [],
+    }
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.closed = False
+
+    def push(self, event: Any) -> None:
+        # Runs on the event loop (via call_soon_threadsafe)
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Too far behind: drop it, the browser reconnects with Last-Event-ID
+            self.closed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class ArticleStream:
+    """Single change stream watcher with fan-out to many SSE subscribers."""
+
+    def __init__(self, coll: Any):
+        self.coll = coll
+        self.resume_token: Optional[Dict] = None
+        # None until the first change stream is open, False if the server
+        # has no change streams (standalone)
+        self.available: Optional[bool] = None
+        self._recent: deque = deque(maxlen=BUFFER_SIZE)  # (event_id, summary)
+        self._subscribers: List[_Subscriber] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="article-stream", daemon=True)
+        self._thread.start()
+
+    @property
+    def closing(self) -> bool:
+        return self._stop.is_set()
+
+    def close_subscribers(self) -> None:
+        """End every open SSE response."""
+        with self._lock:
+            subs, self._subscribers = self._subscribers, []
+        for sub in subs:
+            self._send(sub, None)
+
+    def close(self) -> None:
+        """Stop the watcher and end all responses without blocking."""
+        self._stop.set()
+        self.close_subscribers()
+
+    def stop(self) -> None:
+        self.close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        from pymongo.errors import OperationFailure, PyMongoError
+
+        while not self._stop.is_set():
+            try:
+                with self.coll.watch(
+                    PIPELINE,
+                    resume_after=self.resume_token,
+                    max_await_time_ms=1000,
+                ) as stream:
+                    if self.resume_token is None and self.available:
+                        # restarted without a token: inserts may have been missed
+                        self._reset()
+                    self.available = True
+                    while not self._stop.is_set() and stream.alive:
+                        change = stream.try_next()
+                        if stream.resume_token is not None:
+                            self.resume_token = stream.resume_token
+                        if change is not None:
+                            self._publish(change)
+            except OperationFailure as e:
+                # Standalone servers have no change streams (code 40573);
+                # an expired resume token means we have to start fresh.
+                if e.code == 40573:
+                    print(f"Article stream unavailable: {e}")
+                    self.available = False
+                    self.close_subscribers()
+                    return
+                print(f"Article stream error, restarting: {e}")
+                self.resume_token = None
+            except PyMongoError as e:
+                print(f"Article stream error, retrying: {e}")
+            self._stop.wait(RETRY_DELAY)
+
+    def _send(self, sub: _Subscriber, event: Any) -> None:
+        try:
+            sub.loop.call_soon_threadsafe(sub.push, event)
+        except RuntimeError:
+            # loop already closed
+            self.unsubscribe(sub)
+
+    def _publish(self, change: Dict) -> None:
+        event = (change["_id"]["_data"], article_summary(change.get("fullDocument") or {}))
+        with self._lock:
+            self._recent.append(event)
+            subs = list(self._subscribers)
+        for sub in subs:
+            self._send(sub, event)
+
+    def _reset(self) -> None:
+        # Old event ids can no longer be resumed from
+        with self._lock:
+            self._recent.clear()
+            subs = list(self._subscribers)
+        for sub in subs:
+            self._send(sub, RESET)
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> _Subscriber:
+        sub = _Subscriber(asyncio.get_running_loop())
+        with self._lock:
+            if last_event_id:
+                ids = [eid for eid, _ in self._recent]
+                if last_event_id in ids:
+                    for event in list(self._recent)[ids.index(last_event_id) + 1:]:
+                        sub.push(event)
+                else:
+                    # buffer rolled over or the API restarted: can't replay
+                    sub.push(RESET)
+            self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: _Subscriber) -> None:
+        sub.closed = True
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+
+
+def format_event(event_id: str, summary: Dict) -> str:
+    return f"id: {event_id}\nevent: article\ndata: {json.dumps(summary)}\n\n"
+
+
+async def sse_events(stream: ArticleStream, last_event_id: Optional[str], keepalive: float = 15.0):
+    """Async generator of SSE frames for one client."""
+    sub = stream.subscribe(last_event_id)
+    if stream.closing:
+        stream.unsubscribe(sub)
+        return
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(sub.queue.get(), timeout=keepalive)
+            except asyncio.TimeoutError:
+                # comment line keeps proxies from closing an idle connection
+                yield f": keepalive {int(time.time())}\n\n"
+                continue
+            if event is None or stream.closing:
+                break
+            if event is RESET:
+                yield "event: reset\ndata: {}\n\n"
+                continue
+            yield format_event(*event)
+    finally:
+        stream.unsubscribe(sub)